@@ -5,14 +5,13 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
-from api.core.settings import get_settings
+from api.core.settings import settings
 from api.router import router
 
 BASE_DIR = Path(__file__).resolve().parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
-settings = get_settings()
 
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -27,7 +26,7 @@ app = FastAPI(
     version="1.0.0",
 )
 logger.info("FastAPI application initialized.")
-logger.debug(f"API settings: {settings}")
+logger.debug("API settings: %s", settings)
 
 # Serve static assets (e.g., styles) from the templates directory
 BASE_DIR = Path(__file__).parent.parent
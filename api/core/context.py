@@ -1,11 +1,72 @@
 import re
 from datetime import date
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, List, Optional, Self
+
+from pydantic import BaseModel, Field
 
-from pydantic import BaseModel, Field, HttpUrl, model_validator
 from api.utils.notion import format_br_date
 
-ImgList = List[HttpUrl]
+ImgList = List[str]
+
+# Padrões usados na separação modelo/prefixo do drone
+_PS_RE = re.compile(r"\bps\b", re.IGNORECASE)
+_DASH_TRAIL = re.compile(r"[-–—]\s*$")
+_DASH_LEAD = re.compile(r"^\s*[-–—]")
+_DIGITS = re.compile(r"(\d+)")
+_DASH_SPLIT = re.compile(r"[-–—]")
+_ALL_DIGITS = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=1024)
+def _split_model_prefix(value: str) -> tuple[str, Optional[str]]:
+    # Prioritize 'PS' token: left => modelo, right => prefixo
+    m = _PS_RE.search(value)
+    if m:
+        left = value[: m.start()].strip()
+        right = value[m.end() :].strip()
+        # normaliza separadores residuais
+        left = _DASH_TRAIL.sub("", left).strip()
+        right = _DASH_LEAD.sub("", right).strip()
+        # extrai dígitos do lado direito como prefixo
+        # se não houver dígitos, usa a string direita inteira
+        pm = _DIGITS.search(right)
+        prefix = pm.group(1) if pm else (right or None)
+        return (left or value, prefix)
+
+    # Fallback: comport. anterior (split por traços e heurísticas)
+    parts = [p.strip() for p in _DASH_SPLIT.split(value) if p.strip()]
+    model_parts: list[str] = []
+    prefix: Optional[str] = None
+    for p in parts:
+        if _ALL_DIGITS.fullmatch(p):
+            prefix = p
+        elif p.lower().startswith("ps"):
+            m2 = _DIGITS.search(p)
+            if m2:
+                prefix = m2.group(1)
+        else:
+            model_parts.append(p)
+    model = (
+        " - ".join(model_parts).strip()
+        if model_parts
+        else (parts[0] if parts else value)
+    )
+    return model, prefix
+
+
+class TrustedModel(BaseModel):
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """Instancia sem validação nem coerção de tipos.
+
+        Só é seguro quando os valores já têm exatamente o tipo dos campos.
+        Números do Notion chegam como `int`, e campos `float` ficariam sem
+        conversão (ex.: `10` em vez de `10.0` no relatório); por isso só
+        modelos sem campos numéricos herdam desta classe. Campos obrigatórios
+        ausentes também não geram erro. Na dúvida, use o construtor normal.
+        """
+        return cls.model_construct(**data)
 
 
 class Logo(BaseModel):
@@ -13,7 +74,7 @@ class Logo(BaseModel):
     foot_logo_url: str = Field(description="URL do logo da empresa")
 
 
-class Empresa(BaseModel):
+class Empresa(TrustedModel):
     nome: str = Field(description="Nome da empresa")
     cnpj: str = Field(description="CNPJ da empresa")
     logo: Optional[Logo] = Field(default=None, description="Logos da empresa")
@@ -55,63 +116,22 @@ class Drone(BaseModel):
     drone: str = Field(description="Modelo do drone")
     bico: Optional[str] = Field(default=None, description="Tipo de bico do drone")
     gota: Optional[str] = Field(default=None, description="Tipo de gota utilizada")
+    modelo: Optional[str] = Field(default=None, description="Modelo extraído do drone")
+    prefixo: Optional[str] = Field(
+        default=None, description="Prefixo extraído do drone"
+    )
 
-    @staticmethod
-    def _split_model_prefix(value: str) -> tuple[str, Optional[str]]:
-        # Prioritize 'PS' token: left => modelo, right => prefixo
-        m = re.search(r"\bps\b", value, flags=re.IGNORECASE)
-        if m:
-            left = value[: m.start()].strip()
-            right = value[m.end() :].strip()
-            # normaliza separadores residuais
-            left = re.sub(r"[-–—]\s*$", "", left).strip()
-            right = re.sub(r"^\s*[-–—]", "", right).strip()
-            # extrai dígitos do lado direito como prefixo
-            # se não houver dígitos, usa a string direita inteira
-            pm = re.search(r"(\d+)", right)
-            prefix = pm.group(1) if pm else (right or None)
-            return (left or value, prefix)
-
-        # Fallback: comport. anterior (split por traços e heurísticas)
-        parts = [p.strip() for p in re.split(r"[-–—]", value) if p.strip()]
-        model_parts: list[str] = []
-        prefix: Optional[str] = None
-        for p in parts:
-            if re.fullmatch(r"\d+", p):
-                prefix = p
-            elif p.lower().startswith("ps"):
-                m2 = re.search(r"(\d+)", p)
-                if m2:
-                    prefix = m2.group(1)
-            else:
-                model_parts.append(p)
-        model = (
-            " - ".join(model_parts).strip()
-            if model_parts
-            else (parts[0] if parts else value)
-        )
-        return model, prefix
-
-    @model_validator(mode="before")
-    def _parse_model_and_prefix(cls, values: dict) -> dict:
-        # accept either 'modelo' or legacy 'drone' raw value
-        raw = values.get("modelo") or values.get("drone")
+    @classmethod
+    def from_raw(
+        cls, raw: str, bico: Optional[str] = None, gota: Optional[str] = None
+    ) -> "Drone":
+        """Cria o Drone separando modelo e prefixo do valor bruto do Notion."""
+        modelo: Optional[str] = None
+        prefixo: Optional[str] = None
         if isinstance(raw, str) and raw.strip():
-            model, prefix = cls._split_model_prefix(raw)
-            values["modelo"] = model or raw
-            if prefix and not values.get("prefixo"):
-                values["prefixo"] = prefix
-        return values
-
-    @property
-    def modelo(self) -> str:
-        model, _ = self._split_model_prefix(self.drone)
-        return model
-
-    @property
-    def prefixo(self) -> str:
-        _, prefix = self._split_model_prefix(self.drone)
-        return prefix
+            model, prefixo = _split_model_prefix(raw)
+            modelo = model or raw
+        return cls(drone=raw, bico=bico, gota=gota, modelo=modelo, prefixo=prefixo)
 
 
 class Equipe(BaseModel):
@@ -122,7 +142,7 @@ class Equipe(BaseModel):
     drone: Drone = Field(description="Informações do drone utilizado")
 
 
-class Midia(BaseModel):
+class Midia(TrustedModel):
     mapa: ImgList = Field(description="Imagens do mapa da aplicação")
     alvo: ImgList = Field(
         description="Imagens do papel hidrosensivel comprovando a aplicação"
@@ -131,7 +151,7 @@ class Midia(BaseModel):
     clima: ImgList = Field(description="Imagens das condições climáticas")
 
 
-class Produto(BaseModel):
+class Produto(TrustedModel):
     nome: str = Field(description="Nome do produto utilizado")
     dosagem: str = Field(description="Dosagem do produto utilizado")
 
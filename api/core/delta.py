@@ -1,37 +1,83 @@
 import base64
 import io
+from math import atan, sqrt
 
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.lines import Line2D
+from PIL import Image, ImageDraw
 
 # IMPORTANTE para rodar em servidores (Vercel/Docker):
 # Define o backend do Matplotlib para 'Agg' (não interface gráfica)
 matplotlib.use("Agg")
 ALPHA = 1.0
+DPI = 90
+XLIM = (0, 50)
+YLIM = (10, 100)
+
+# Marcador (em pontos, mesmo padrão do `ax.plot(marker="o")` anterior)
+MARKER_SIZE_PT = 10
+MARKER_EDGE_PT = 2
+
+# Temperatura (coluna) onde os rótulos das isolinhas são posicionados
+LABEL_TEMP = 47.5
 
 
 def calculate_wet_bulb(temp, rh):
+    # sqrt em vez de potências fracionárias (**0.5, **1.5), que são bem
+    # mais caras por elemento
     return (
-        temp * np.arctan(0.151977 * (rh + 8.313659) ** 0.5)
+        temp * np.arctan(0.151977 * np.sqrt(rh + 8.313659))
         + np.arctan(temp + rh)
         - np.arctan(rh - 1.676331)
-        + 0.00391838 * (rh**1.5) * np.arctan(0.023101 * rh)
+        + 0.00391838 * rh * np.sqrt(rh) * np.arctan(0.023101 * rh)
         - 4.686035
     )
 
 
-def get_delta_t_image(current_temp=None, current_rh=None):
-    # Configuração do gráfico (mesma lógica do código anterior)
-    # Malha vai um pouco além dos limites para preencher todo o espaço
-    temp_range = np.linspace(0, 52, 220)
-    rh_range = np.linspace(8, 102, 220)
-    T, RH = np.meshgrid(temp_range, rh_range)
-    DeltaT = T - calculate_wet_bulb(T, RH)
+# Malha vai um pouco além dos limites para preencher todo o espaço.
+# Calculada uma única vez, na importação do módulo.
+_T_GRID, _RH_GRID = np.meshgrid(np.linspace(0, 52, 110), np.linspace(8, 102, 110))
+_DELTA_T_GRID = _T_GRID - calculate_wet_bulb(_T_GRID, _RH_GRID)
+
+
+def _calculate_wet_bulb_scalar(temp, rh):
+    # Mesma fórmula de calculate_wet_bulb para um único ponto: math.atan
+    # evita o custo de despacho das ufuncs do numpy em escalares
+    return (
+        temp * atan(0.151977 * sqrt(rh + 8.313659))
+        + atan(temp + rh)
+        - atan(rh - 1.676331)
+        + 0.00391838 * rh * sqrt(rh) * atan(0.023101 * rh)
+        - 4.686035
+    )
+
+
+def _isoline_rh(level, temp=LABEL_TEMP, iterations=40):
+    """Umidade onde a isolinha `level` de Delta T cruza a temperatura `temp`.
+
+    Delta T decresce com a umidade, então uma bisseção sobre YLIM resolve
+    `temp - calculate_wet_bulb(temp, rh) = level`.
+    """
+    lo, hi = YLIM
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        if temp - _calculate_wet_bulb_scalar(temp, mid) > level:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
 
+
+def _render_background():
+    """Renderiza uma única vez o gráfico estático (sem o marcador).
+
+    Retorna a imagem PIL e a função que converte (temperatura, umidade)
+    em coordenadas de pixel da imagem recortada.
+    """
     # Quadro quadrado, ajuste com box_aspect
-    fig, ax = plt.subplots(figsize=(7, 7), dpi=90)
+    fig, ax = plt.subplots(figsize=(7, 7), dpi=DPI)
     levels = [0, 2, 8, 10, 20]
     line_levels = [2, 4, 6, 8, 10, 12, 14, 16, 18, 20]
     fill_colors = ["#FFC825", "#2F963A", "#FFC825", "#F66139"]
@@ -52,28 +98,39 @@ def get_delta_t_image(current_temp=None, current_rh=None):
     _norm = matplotlib.colors.BoundaryNorm(levels, cmap.N)
 
     # Preenchimento opaco (sem transparência)
-    ax.contourf(T, RH, DeltaT, levels=levels, cmap=cmap, alpha=ALPHA, extend="both")
-    lines = ax.contour(
-        T, RH, DeltaT, levels=line_levels, colors=line_colors, linewidths=1.0
+    ax.contourf(
+        _T_GRID,
+        _RH_GRID,
+        _DELTA_T_GRID,
+        levels=levels,
+        cmap=cmap,
+        alpha=ALPHA,
+        extend="both",
+        algorithm="serial",
+    )
+    ax.contour(
+        _T_GRID,
+        _RH_GRID,
+        _DELTA_T_GRID,
+        levels=line_levels,
+        colors=line_colors,
+        linewidths=1.0,
+        algorithm="serial",
     )
-    ax.clabel(lines, inline=True, fontsize=9, colors=line_colors)
-
-    # Sem marcadores adicionais nas linhas de contorno
-
-    # Se houver dados atuais, marca no gráfico
-    if current_temp is not None and current_rh is not None:
-        ax.plot(
-            current_temp,
-            current_rh,
-            marker="o",
-            markersize=10,
-            color="white",
-            markeredgecolor="black",
-            markeredgewidth=2,
+    # Rótulos fixos em vez de clabel (posicionamento por segmento é caro)
+    for lvl, color in zip(line_levels, line_colors, strict=True):
+        ax.text(
+            LABEL_TEMP,
+            _isoline_rh(lvl),
+            str(lvl),
+            color=color,
+            fontsize=9,
+            ha="center",
+            va="bottom",
         )
 
-    ax.set_xlim(0, 50)
-    ax.set_ylim(10, 100)
+    ax.set_xlim(*XLIM)
+    ax.set_ylim(*YLIM)
     ax.set_box_aspect(1)  # força a área do gráfico a ser quadrada
     ax.set_xticks(np.arange(0, 55, 5))
     ax.set_yticks(np.arange(10, 110, 10))
@@ -112,9 +169,58 @@ def get_delta_t_image(current_temp=None, current_rh=None):
         title_fontsize=11,
     )
 
-    buf = io.BytesIO()
+    # Recorte equivalente ao bbox_inches="tight", mas com caixa conhecida
+    # para podermos mapear dados -> pixels da imagem final
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(
+        plt.rcParams["savefig.pad_inches"]
+    )
+    (a, b, c), (d, e, f), _ = ax.transData.frozen().get_matrix()
+    x0 = bbox.x0 * DPI
+    y1 = bbox.y1 * DPI
 
-    plt.savefig(buf, format="png", bbox_inches="tight")
+    def to_pixel(point):
+        t, rh = point
+        # origem do PNG no canto superior esquerdo
+        return a * t + b * rh + c - x0, y1 - (d * t + e * rh + f)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches=bbox)
     plt.close(fig)  # Importante para liberar memória
-    data = base64.b64encode(buf.getbuffer()).decode("ascii")
+    buf.seek(0)
+    image = Image.open(buf)
+    image.load()
+    return image, to_pixel
+
+
+_BG_IMAGE, _BG_TX = _render_background()
+
+
+def get_delta_t_image(current_temp=None, current_rh=None):
+    img = _BG_IMAGE.copy()
+
+    # Se houver dados atuais e dentro dos eixos, marca no gráfico
+    if (
+        current_temp is not None
+        and current_rh is not None
+        and XLIM[0] <= current_temp <= XLIM[1]
+        and YLIM[0] <= current_rh <= YLIM[1]
+    ):
+        px, py = _BG_TX((current_temp, current_rh))
+        edge = MARKER_EDGE_PT * DPI / 72
+        radius = (MARKER_SIZE_PT * DPI / 72 + edge) / 2
+        ImageDraw.Draw(img).ellipse(
+            (px - radius, py - radius, px + radius, py + radius),
+            fill="white",
+            outline="black",
+            width=round(edge),
+        )
+
+    # compress_level=1: zlib bem mais rápido, PNG um pouco maior (vai
+    # embutido em base64 no HTML de qualquer forma)
+    buf = io.BytesIO()
+    img.save(buf, "PNG", optimize=False, compress_level=1)
+    png_bytes = buf.getvalue()
+    buf.close()
+    data = base64.b64encode(png_bytes).decode("ascii")
+    del png_bytes
     return data
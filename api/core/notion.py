@@ -1,13 +1,17 @@
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
 from notion_client import AsyncClient
+from notion_client.helpers import async_iterate_paginated_api
 
-from api.core.settings import get_settings
+from api.core.settings import settings
 from api.utils.notion import simplify_properties_map
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
+
+# Max concurrent Notion requests issued by batch helpers
+MAX_CONCURRENT_REQUESTS = 10
 
 
 class Notion:
@@ -17,7 +21,11 @@ class Notion:
         self.notion_token = settings.notion_token
         self.database_id = settings.notion_database_id
         self._client: Optional[AsyncClient] = None
-        logger.debug(f"Notion wrapper initialized with database_id: {self.database_id}")
+        self._data_source_id: Optional[str] = None
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        logger.debug(
+            "Notion wrapper initialized with database_id: %s", self.database_id
+        )
 
     async def __aenter__(self) -> "Notion":
         """Open AsyncClient for use inside `async with`."""
@@ -41,7 +49,7 @@ class Notion:
         self, filter: Dict[str, Any] | None = None
     ) -> Dict[str, Any]:
         """Query the Notion database."""
-        logger.debug(f"Querying database {self.database_id} with filter: {filter}")
+        logger.debug("Querying database %s with filter: %s", self.database_id, filter)
         try:
             client = self._ensure_client()
             result = await client.databases.query(
@@ -49,26 +57,60 @@ class Notion:
                 filter=filter or {},
             )
             logger.info(
-                f"Queried database {self.database_id} with ",
-                f" {len(result.get('results', []))} results.",
+                "Queried database %s with %d results.",
+                self.database_id,
+                len(result.get("results", [])),
             )
             return result
         except Exception as e:
             logger.error(
-                f"Error querying database {self.database_id}: {e}", exc_info=True
+                "Error querying database %s: %s", self.database_id, e, exc_info=True
             )
             raise
 
+    async def _get_data_source_id(self) -> str:
+        """Resolve (once) the data source backing the configured database.
+
+        Since API version 2025-09-03 rows are queried per data source; the
+        database's first data source is used.
+        """
+        if self._data_source_id is None:
+            client = self._ensure_client()
+            database = await client.databases.retrieve(database_id=self.database_id)
+            data_sources = database.get("data_sources") or []
+            if not data_sources:
+                raise ValueError(f"Database {self.database_id} has no data sources")
+            self._data_source_id = data_sources[0]["id"]
+        return self._data_source_id
+
+    async def iter_database(
+        self, filter: Dict[str, Any] | None = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every row of the Notion database, following pagination cursors.
+
+        Rows are yielded as each page of results arrives, so callers using
+        `async for` can process them while the next page is being fetched.
+        """
+        logger.debug("Iterating database %s with filter: %s", self.database_id, filter)
+        client = self._ensure_client()
+        kwargs: Dict[str, Any] = {"data_source_id": await self._get_data_source_id()}
+        if filter:
+            kwargs["filter"] = filter
+        async for row in async_iterate_paginated_api(
+            client.data_sources.query, **kwargs
+        ):
+            yield row
+
     async def get_page(self, page_id: str) -> Dict[str, Any]:
         """Retrieve a single page by ID."""
-        logger.debug(f"Retrieving page: {page_id}")
+        logger.debug("Retrieving page: %s", page_id)
         try:
             client = self._ensure_client()
             page = await client.pages.retrieve(page_id=page_id)
-            logger.info(f"Successfully retrieved page: {page_id}")
+            logger.info("Successfully retrieved page: %s", page_id)
             return page
         except Exception as e:
-            logger.error(f"Error retrieving page {page_id}: {e}", exc_info=True)
+            logger.error("Error retrieving page %s: %s", page_id, e, exc_info=True)
             raise
 
     async def get_page_data(self, page_id: str) -> Dict[str, Any]:
@@ -76,3 +118,16 @@ class Notion:
         page = await self.get_page(page_id)
         props = page.get("properties", {})
         return simplify_properties_map(props)
+
+    async def get_pages_data(self, page_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Return simplified property maps for many pages, fetched concurrently.
+
+        Results keep the order of `page_ids`; at most MAX_CONCURRENT_REQUESTS
+        requests are in flight at once.
+        """
+
+        async def one(page_id: str) -> Dict[str, Any]:
+            async with self._sem:
+                return await self.get_page_data(page_id)
+
+        return list(await asyncio.gather(*(one(pid) for pid in page_ids)))
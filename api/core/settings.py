@@ -1,4 +1,3 @@
-from functools import lru_cache
 from typing import Literal
 
 from pydantic import Field
@@ -38,6 +37,9 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache
+# Loaded once at import: .env is read and validated here only
+settings: Settings = Settings()
+
+
 def get_settings() -> Settings:
-    return Settings()
+    return settings
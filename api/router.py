@@ -1,9 +1,14 @@
+import asyncio
 import logging
-from datetime import date
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timezone
 from pathlib import Path
 
 from fastapi import APIRouter, Request
+from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from api.core.context import (
     Clima,
@@ -17,7 +22,8 @@ from api.core.context import (
 )
 from api.core.delta import get_delta_t_image
 from api.core.notion import Notion
-from api.core.settings import get_settings
+from api.core.settings import settings
+from api.utils.notion import simplify_properties_map
 from api.utils.produtos import parse_produtos
 
 logger = logging.getLogger(__name__)
@@ -26,17 +32,82 @@ router = APIRouter()
 # Use absolute path relative to this file's location
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+# Cache de bytecode em disco (diretório temporário, gravável na Vercel) e
+# sem checagem de mtime: os templates só mudam com um novo deploy
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = False
+# Compila o relatório já no import para não pagar isso no primeiro request
+templates.env.get_template("report.html")
+
+
+# Cache de relatórios renderizados (LRU + TTL). A chave inclui o
+# last_edited_time da página, então edições na própria página invalidam a
+# entrada; inclui também a data de hoje (data de emissão no HTML) e a URL
+# base do request (usada pelo url_for dos assets).
+# Limitações: last_edited_time tem precisão de minuto (páginas editadas no
+# minuto corrente não são cacheadas) e não muda quando uma página
+# relacionada/rollup é editada; essas mudanças aparecem em até
+# REPORT_CACHE_TTL segundos.
+ReportKey = tuple[str, str, str, str]
+REPORT_CACHE_SIZE = 200
+REPORT_CACHE_TTL = 60  # segundos, igual ao max-age
+REPORT_CACHE_HEADERS = {"Cache-Control": f"private, max-age={REPORT_CACHE_TTL}"}
+_REPORT_CACHE: "OrderedDict[ReportKey, tuple[float, bytes]]" = OrderedDict()
+
+
+def _cache_get(key: ReportKey) -> bytes | None:
+    entry = _REPORT_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, body = entry
+    if time.monotonic() - stored_at > REPORT_CACHE_TTL:
+        del _REPORT_CACHE[key]
+        return None
+    _REPORT_CACHE.move_to_end(key)
+    return body
+
+
+def _edited_this_minute(last_edited_time: str) -> bool:
+    # Uma segunda edição no mesmo minuto não muda o last_edited_time
+    try:
+        edited = datetime.fromisoformat(last_edited_time)
+    except ValueError:
+        return True
+    if edited.tzinfo is None:
+        edited = edited.replace(tzinfo=timezone.utc)
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    return edited >= now
+
+
+def _cache_put(key: ReportKey, body: bytes) -> None:
+    _REPORT_CACHE[key] = (time.monotonic(), body)
+    _REPORT_CACHE.move_to_end(key)
+    while len(_REPORT_CACHE) > REPORT_CACHE_SIZE:
+        _REPORT_CACHE.popitem(last=False)
 
 
 @router.get("/drone/{page_id}", tags=["Notion"])
 async def get_drone_report(request: Request, page_id: str):
-    logger.debug(f"Received request for drone report with page ID: {page_id}")
+    logger.debug("Received request for drone report with page ID: %s", page_id)
     logger.info(request)
 
     async with Notion() as notion:
-        response = await notion.get_page_data(page_id)
-        logger.debug(f"Notion response data: {response}")
-    logger.info(f"Fetched data for page ID {page_id}")
+        page = await notion.get_page(page_id)
+    logger.info("Fetched data for page ID %s", page_id)
+
+    cache_key = (
+        page_id,
+        page.get("last_edited_time") or "",
+        str(date.today()),
+        str(request.base_url),
+    )
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        logger.info("Serving cached report for page ID %s", page_id)
+        return HTMLResponse(cached, headers=REPORT_CACHE_HEADERS)
+
+    response = simplify_properties_map(page.get("properties", {}))
+    logger.debug("Notion response data: %s", response)
 
     empresa = Empresa(nome=response.get("empresa"), cnpj=response.get("cnpj"))
     gerais = Gerais(
@@ -59,13 +130,13 @@ async def get_drone_report(request: Request, page_id: str):
         caar=response.get("caar", ""),
         altura=response.get("altura_de_voo", ""),
         assistente=response.get("assistente", ""),
-        drone=Drone(
-            drone=response.get("drone"),
+        drone=Drone.from_raw(
+            response.get("drone"),
             bico=response.get("drone_bico"),
             gota=response.get("rpm_tipo_de_gota")[0],
         ),
     )
-    midia = Midia(
+    midia = Midia.from_trusted(
         mapa=response.get("mapa_aplicacao", []),
         alvo=response.get("papel_hidronssensivel", []),
         produto=response.get("foto_dos_produtos", []),
@@ -84,10 +155,12 @@ async def get_drone_report(request: Request, page_id: str):
         vento=response.get("velocidade_vento"),
     )
 
-    chart_base64 = get_delta_t_image(clima.temperatura, clima.umidade)
+    # Renderiza o gráfico numa thread para não bloquear o event loop
+    chart_base64 = await asyncio.to_thread(
+        get_delta_t_image, clima.temperatura, clima.umidade
+    )
 
     # Prepara dados para o script de download PDF
-    settings = get_settings()
     farm_code = gerais.fazenda.replace(" ", "-") if gerais.fazenda else "relatorio"
     today_date = str(date.today())
 
@@ -107,7 +180,12 @@ async def get_drone_report(request: Request, page_id: str):
         "pdf_service_url": settings.pdf_service_url,
     }
 
-    logger.info(f"Rendering report for page ID {page_id}")
-    logger.debug(f"Report context data: {result}")
-    return templates.TemplateResponse("report.html", result)
+    logger.info("Rendering report for page ID %s", page_id)
+    logger.debug("Report context data: %s", result)
+    rendered = templates.TemplateResponse(
+        "report.html", result, headers=REPORT_CACHE_HEADERS
+    )
+    if not _edited_this_minute(cache_key[1]):
+        _cache_put(cache_key, rendered.body)
+    return rendered
     # return response
@@ -1,12 +1,32 @@
 """HTML manipulation utilities."""
 
 import base64
-import mimetypes
-from logging import getLogger
+import re
+from functools import lru_cache
+from logging import DEBUG, getLogger
 from pathlib import Path
 
 logger = getLogger(__name__)
 
+_IMG_SRC_RE = re.compile(r'src="((?:\./)?images/[^"]+)"')
+# CSS link tag (same two forms as inline_css) or local image src, in one scan
+_ASSET_RE = re.compile(
+    r'<link rel="stylesheet" href="(?:\./)?styles\.css">|src="((?:\./)?images/[^"]+)"'
+)
+_B64_CHUNK_SIZE = 48 * 1024
+# Web image formats used by the templates; avoids initializing the mimetypes DB
+_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".avif": "image/avif",
+    ".bmp": "image/bmp",
+    ".ico": "image/vnd.microsoft.icon",
+}
+
 
 def data_uri_for_local_image(template_dir: Path, rel_path: str) -> str | None:
     """Convert local image to data URI for embedding in HTML.
@@ -34,17 +54,30 @@ def data_uri_for_local_image(template_dir: Path, rel_path: str) -> str | None:
             return None
 
     try:
-        data = img_path.read_bytes()
-        mime, _ = mimetypes.guess_type(str(img_path))
-        if not mime:
-            mime = "image/jpeg"
-        b64 = base64.b64encode(data).decode("ascii")
-        return f"data:{mime};base64,{b64}"
+        return _encode_data_uri(str(img_path))
     except Exception as e:
         logger.exception("Failed to inline image %s: %s", img_path, e)
         return None
 
 
+@lru_cache(maxsize=256)
+def _encode_data_uri(img_path_str: str) -> str:
+    # Same assets (logos, headers) are inlined in every report; call
+    # `_encode_data_uri.cache_clear()` if template images change at runtime.
+    # Only successful encodes are cached: failures raise, and lru_cache does
+    # not store exceptions, so a transient read error is retried next time.
+    img_path = Path(img_path_str)
+    mime = _MIME.get(img_path.suffix.lower(), "image/jpeg")
+    # Encode in chunks so the raw file is never held next to its base64
+    # copy; chunk size is a multiple of 3, so no padding mid-stream
+    buf = bytearray()
+    with img_path.open("rb") as f:
+        while chunk := f.read(_B64_CHUNK_SIZE):
+            buf += base64.b64encode(chunk)
+    b64 = buf.decode("ascii")
+    return f"data:{mime};base64,{b64}"
+
+
 def inline_css(html: str, css_content: str) -> str:
     """Inline CSS content into HTML by replacing link tags.
 
@@ -77,35 +110,12 @@ def inline_local_images(html: str, template_dir: Path) -> str:
     Returns:
         HTML with inlined images
     """
-    markers = [
-        'src="./images/',
-        'src="images/',
-    ]
-
-    for marker in markers:
-        start = 0
-        while True:
-            idx = html.find(marker, start)
-            if idx == -1:
-                break
-
-            # Find the opening and closing quotes of the src attribute
-            q1 = html.find('"', idx)  # the first quote after src=
-            q2 = html.find('"', q1 + 1)
-
-            if q1 == -1 or q2 == -1:
-                break
-
-            path_val = html[q1 + 1 : q2]
-            data_uri = data_uri_for_local_image(template_dir, path_val)
-
-            if data_uri:
-                html = html[: q1 + 1] + data_uri + html[q2:]
-                start = q1 + 1 + len(data_uri)
-            else:
-                start = q2 + 1
 
-    return html
+    def repl(match: re.Match) -> str:
+        data_uri = data_uri_for_local_image(template_dir, match.group(1))
+        return f'src="{data_uri}"' if data_uri else match.group(0)
+
+    return _IMG_SRC_RE.sub(repl, html)
 
 
 def inline_assets(html: str, template_dir: Path, css_content: str) -> str:
@@ -119,9 +129,20 @@ def inline_assets(html: str, template_dir: Path, css_content: str) -> str:
     Returns:
         HTML with all assets inlined
     """
-    html = inline_css(html, css_content)
-    html = inline_local_images(html, template_dir)
+    style_tag = f"<style>\n{css_content}\n</style>" if css_content else None
+
+    def repl(match: re.Match) -> str:
+        rel_path = match.group(1)
+        if rel_path is None:
+            return style_tag or match.group(0)
+        data_uri = data_uri_for_local_image(template_dir, rel_path)
+        return f'src="{data_uri}"' if data_uri else match.group(0)
+
+    # Single pass instead of inline_css + inline_local_images
+    html = _ASSET_RE.sub(repl, html)
 
-    logger.debug("HTML content after inlining assets: %s", html[:500])
+    if logger.isEnabledFor(DEBUG):
+        # avoid slicing the (large) document when debug logging is off
+        logger.debug("HTML content after inlining assets: %s", html[:500])
 
     return html
@@ -5,6 +5,17 @@ from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
+import orjson
+
+# Fast path for the default indent=2. orjson encodes datetime, date and UUID
+# natively (same text as isoformat()/str()); anything else it can't encode
+# exactly like json.dumps (non-str keys, dataclasses, numpy, ints over 64
+# bits, ...) raises TypeError and goes through the stdlib encoder instead.
+# Known differences from json.dumps: Enum members encode as their value (not
+# str(member)), NaN/Infinity become null, and small floats drop the exponent
+# padding (1e-7 instead of 1e-07).
+_ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+
 
 def json_default_handler(obj: Any) -> str:
     """Handle common non-serializable types for JSON encoding.
@@ -32,6 +43,11 @@ def to_json_string(obj: dict, indent: int = 2) -> str:
     Returns:
         JSON string representation
     """
+    if indent == 2:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            pass
     try:
         return json.dumps(
             obj, ensure_ascii=False, indent=indent, default=json_default_handler
@@ -3,11 +3,16 @@ import unicodedata
 from datetime import date, datetime
 from functools import lru_cache
 from logging import getLogger
+from operator import methodcaller
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 logger = getLogger(__name__)
 DATE_FORMAT = "%d/%m/%Y"
 
+_NON_ALNUM_SPACE = re.compile(r"[^a-z0-9\s]+")
+_MULTI_WS = re.compile(r"\s+")
+_DASH_TBL = str.maketrans("", "", "-")
+
 
 def _string_contains_time(s: str) -> bool:
     """Detecta se a string contém um componente de hora (HH:MM).
@@ -17,7 +22,17 @@ def _string_contains_time(s: str) -> bool:
     """
     if not s or not isinstance(s, str):
         return False
-    return bool(re.search(r"\d{2}:\d{2}", s))
+    # Equivale a re.search(r"\d{2}:\d{2}", s) sem passar pelo motor de regex
+    i = s.find(":", 2)
+    while i != -1:
+        if (
+            i + 3 <= len(s)
+            and s[i - 2 : i].isdecimal()
+            and s[i + 1 : i + 3].isdecimal()
+        ):
+            return True
+        i = s.find(":", i + 1)
+    return False
 
 
 def format_br_date(value):
@@ -45,8 +60,14 @@ def format_br_date(value):
         s = value.strip()
         if not s:
             return ""
+        # caso mais comum do Notion (dia inteiro): 'YYYY-MM-DD'
+        if len(s) == 10 and s[4] == "-" == s[7]:
+            try:
+                return date.fromisoformat(s).strftime(DATE_FORMAT)
+            except ValueError:
+                return s
         # normaliza 'Z' -> '+00:00' para fromisoformat
-        iso = s.replace("Z", "+00:00")
+        iso = s[:-1] + "+00:00" if s.endswith("Z") else s
         try:
             parsed = datetime.fromisoformat(iso)
             # se a string contém hora explicitamente, preserva hora
@@ -70,32 +91,72 @@ def format_br_date(value):
 # --------------------
 # Normalization
 # --------------------
+class _CombiningTable(dict):
+    """Tabela para `str.translate` que remove marcas combinantes.
+
+    Preenchida sob demanda: cada code point é classificado uma única vez.
+    """
+
+    def __missing__(self, cp: int) -> Optional[int]:
+        value = None if unicodedata.combining(chr(cp)) else cp
+        self[cp] = value
+        return value
+
+
+_COMBINING_TBL = _CombiningTable()
+
+
+def _nfkd_strip_combining(name: str) -> str:
+    return unicodedata.normalize("NFKD", name).translate(_COMBINING_TBL)
+
+
+# NFKD sem marcas combinantes, pré-calculado para Latin-1 e Latin Extended
+# (acentos do português e afins) — apenas mapeamentos que resultam em ASCII
+_ACCENT_TABLE = {
+    cp: folded
+    for cp in range(0xA0, 0x250)
+    if (folded := _nfkd_strip_combining(chr(cp))).isascii()
+}
+
+
+def _strip_accents(name: str) -> str:
+    s = name.translate(_ACCENT_TABLE)
+    if s.isascii():
+        return s
+    # caracteres fora da tabela: caminho completo (raro)
+    return _nfkd_strip_combining(name)
+
+
 def _normalize_prop_name_impl(name: str) -> str:
     if not name:
         return ""
-    nfkd = unicodedata.normalize("NFKD", name)
-    no_accents = "".join(ch for ch in nfkd if not unicodedata.combining(ch))
-    s = no_accents.lower()
-    s = re.sub(r"[^a-z0-9\s]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _strip_accents(name).lower()
+    s = _NON_ALNUM_SPACE.sub(" ", s)
+    s = _MULTI_WS.sub(" ", s).strip()
     return s
 
 
 def _normalize_property_name_flexible_impl(name: str) -> str:
     if not name:
         return ""
-    nfkd = unicodedata.normalize("NFKD", name)
-    no_accents = "".join(ch for ch in nfkd if not unicodedata.combining(ch))
-    normalized = no_accents.lower().strip()
-    normalized = re.sub(r"[^a-z0-9\s]+", "", normalized)
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = _strip_accents(name).lower().strip()
+    normalized = _NON_ALNUM_SPACE.sub("", normalized)
+    normalized = _MULTI_WS.sub(" ", normalized).strip()
     return normalized
 
 
+def _to_snake_impl(name: str) -> str:
+    # cached_normalize_prop_name já devolve tokens [a-z0-9] separados por um
+    # único espaço, sem espaços nas pontas
+    n = cached_normalize_prop_name(name)
+    return n.replace(" ", "_") if n else ""
+
+
 cached_normalize_prop_name = lru_cache(maxsize=2048)(_normalize_prop_name_impl)
 cached_normalize_prop_name_flexible = lru_cache(maxsize=2048)(
     _normalize_property_name_flexible_impl
 )
+cached_to_snake = lru_cache(maxsize=4096)(_to_snake_impl)
 
 
 def normalize_prop_name(name: str) -> str:
@@ -115,12 +176,11 @@ def normalize_property_name_flexible(name: str) -> str:
 
 
 def to_snake(name: str) -> str:
-    n = normalize_prop_name(name)
-    if not n:
+    try:
+        return cached_to_snake(name or "")
+    except Exception:  # pragma: no cover
+        logger.exception("Error converting property name to snake_case")
         return ""
-    s = re.sub(r"\s+", "_", n)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
 
 
 def normalize_properties(props: Mapping[str, Any]) -> Dict[str, Tuple[str, Any]]:
@@ -131,35 +191,45 @@ def normalize_properties(props: Mapping[str, Any]) -> Dict[str, Tuple[str, Any]]
         if not isinstance(orig_key, str):
             continue
         snake = to_snake(orig_key)
-        if not snake:
-            continue
-        if snake not in norm:
-            norm[snake] = (orig_key, val)
+        if snake:
+            # mantém a primeira chave original que normaliza para `snake`
+            norm.setdefault(snake, (orig_key, val))
     return norm
 
 
 # --------------------
 # Regex search helper
 # --------------------
+@lru_cache(maxsize=256)
+def _compile_ci(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern, flags=re.IGNORECASE)
+
+
 def find_property_by_regex(props: Mapping[str, Any], pattern: str) -> Optional[Any]:
     if not props or not pattern:
         return None
     try:
-        reg = re.compile(pattern, flags=re.IGNORECASE)
+        reg = _compile_ci(pattern)
     except re.error:
         logger.warning("Invalid regex in find_property_by_regex: %s", pattern)
         return None
 
-    norm = normalize_properties(props)
-    for snake, (_, val) in norm.items():
-        if reg.search(snake):
-            return val
-
+    # Uma única passada: o nome em snake_case tem prioridade e encerra a busca;
+    # o primeiro acerto pela normalização flexível fica guardado como reserva
+    fallback: Any = None
+    found_fallback = False
     for orig_key, val in props.items():
-        nk = normalize_property_name_flexible(orig_key)
-        if reg.search(nk):
+        if not isinstance(orig_key, str):
+            continue
+        snake = to_snake(orig_key)
+        if snake and reg.search(snake):
             return val
-    return None
+        if not found_fallback and reg.search(
+            normalize_property_name_flexible(orig_key)
+        ):
+            fallback = val
+            found_fallback = True
+    return fallback
 
 
 # --------------------
@@ -168,6 +238,13 @@ def find_property_by_regex(props: Mapping[str, Any], pattern: str) -> Optional[A
 def plain_text(rich: Iterable[Mapping[str, Any]]) -> str:
     if not rich:
         return ""
+    # caso mais comum (títulos): um único segmento, sem lista nem join
+    if isinstance(rich, (list, tuple)) and len(rich) == 1:
+        seg = rich[0]
+        if not isinstance(seg, Mapping):
+            return ""
+        pt = seg.get("plain_text") or (seg.get("text") or {}).get("content") or ""
+        return str(pt) if pt else ""
     parts: List[str] = []
     for seg in rich:
         if not isinstance(seg, Mapping):
@@ -197,7 +274,9 @@ def extract_relation_ids(prop: Mapping[str, Any]) -> List[str]:
             continue
         rid = r.get("id")
         if rid:
-            ids.append(str(rid).replace("-", ""))
+            if not isinstance(rid, str):
+                rid = str(rid)
+            ids.append(rid.translate(_DASH_TBL))
     return ids
 
 
@@ -329,36 +408,46 @@ def simplify_property(prop: Mapping[str, Any]) -> Any:
 
 
 def simplify_properties_map(props: Mapping[str, Any]) -> Dict[str, Any]:
-    norm = normalize_properties(props)
+    # Normaliza e simplifica na mesma passada, sem o dict intermediário de
+    # normalize_properties; a primeira chave que normaliza para `snake` vence
     simplified: Dict[str, Any] = {}
-    for snake, (_orig, raw) in norm.items():
+    if not props:
+        return simplified
+    for orig_key, raw in props.items():
+        if not isinstance(orig_key, str):
+            continue
+        snake = to_snake(orig_key)
+        if not snake or snake in simplified:
+            continue
         simplified[snake] = simplify_property(
             raw if isinstance(raw, Mapping) else {"type": None}
         )
     return simplified
 
 
+# Tipos simples usam methodcaller("get", ...) em vez de lambdas: a chamada
+# fica em C, sem criar um frame Python por propriedade
 _PROPERTY_EXTRACTORS: Dict[str, Callable[[Mapping[str, Any]], Any]] = {
     "rollup": extract_rollup,
-    "title": lambda prop: extract_title(prop),
-    "rich_text": lambda prop: extract_rich_text(prop),
-    "number": lambda prop: prop.get("number"),
+    "title": extract_title,
+    "rich_text": extract_rich_text,
+    "number": methodcaller("get", "number"),
     "select": _select_name,
     "multi_select": _multi_select_names,
     "relation": extract_relation_ids,
     "people": _people_list,
     "date": extract_date,
-    "checkbox": lambda prop: prop.get("checkbox"),
-    "url": lambda prop: prop.get("url"),
-    "email": lambda prop: prop.get("email"),
-    "phone_number": lambda prop: prop.get("phone_number"),
+    "checkbox": methodcaller("get", "checkbox"),
+    "url": methodcaller("get", "url"),
+    "email": methodcaller("get", "email"),
+    "phone_number": methodcaller("get", "phone_number"),
     "status": _status_name,
     "files": extract_files,
     "formula": extract_formula,
     "created_by": _created_by,
     "last_edited_by": _last_edited_by,
-    "created_time": lambda prop: prop.get("created_time"),
-    "last_edited_time": lambda prop: prop.get("last_edited_time"),
+    "created_time": methodcaller("get", "created_time"),
+    "last_edited_time": methodcaller("get", "last_edited_time"),
     "unique_id": _unique_id,
     "verification": _verification,
 }
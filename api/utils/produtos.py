@@ -1,5 +1,18 @@
 import re
 
+# Nome (até o primeiro dígito) + dosagem (número + unidade opcional), numa
+# única passada sobre a linha; separadores ("..", "--", "——") entre número e
+# unidade são consumidos pela própria regex
+PRODUCT_RE = re.compile(
+    r"^(?P<name>.+?)(?P<num>\d+(?:[.,]\d+)?)(?:\s|[\.—-]{2,})*"
+    r"(?P<unit>ml|mL|l|lt|lts|LTS|LT|L|grs?|gr|GR|GRS|kg|KG|g|G)?",
+    re.IGNORECASE,
+)
+# Limpeza do nome capturado: travessões/pontos múltiplos e sobras no fim
+SEP_RE = re.compile(r"[\.—-]{2,}")
+TRAIL_RE = re.compile(r"[\.—\s]+$")
+_HEADERS = frozenset({"dose por ha", "produtos", "calda"})
+
 
 def parse_produtos(texto_produtos):
     """
@@ -24,28 +37,19 @@ def parse_produtos(texto_produtos):
         linha = linha.strip()
 
         # Pula linhas vazias ou cabeçalhos genéricos
-        if not linha or linha.lower() in ["dose por ha", "produtos", "calda"]:
+        if not linha or linha.lower() in _HEADERS:
             continue
 
-        # Remove travessões/pontos múltiplos que separam nome e dosagem
-        linha_limpa = re.sub(r"[\.—-]{2,}", " ", linha)
-
         # Tenta extrair: nome (até o número) + dosagem (número + unidade)
-        # Regex: captura tudo antes do número, depois número + unidade opcional
-        # Permite espaço opcional antes do número
-        match = re.match(
-            r"^(.+?)\s*(\d+(?:[.,]\d+)?)\s*(ml|mL|l|lt|lts|LTS|LT|L|grs?|gr|GR|GRS|kg|KG|g|G)?",
-            linha_limpa,
-            re.IGNORECASE,
-        )
+        match = PRODUCT_RE.match(linha)
 
         if match:
-            nome = match.group(1).strip()
-            numero = match.group(2).replace(",", ".")
-            unidade = match.group(3) if match.group(3) else ""
+            nome, numero, unidade = match.group("name", "num", "unit")
+            numero = numero.replace(",", ".")
+            unidade = unidade or ""
 
-            # Limpa pontos/travessões extras do nome
-            nome = re.sub(r"[\.—\s]+$", "", nome).strip()
+            # Remove travessões/pontos do nome (separadores e sobras no fim)
+            nome = TRAIL_RE.sub("", SEP_RE.sub(" ", nome).strip()).strip()
 
             # Monta dosagem
             dosagem = f"{numero} {unidade}".strip()